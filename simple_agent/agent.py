@@ -1,40 +1,23 @@
-import os
 from datetime import datetime
 from google.adk.agents.llm_agent import Agent
+from google.adk.tools.function_tool import FunctionTool
 
-from tavily import TavilyClient
-from dotenv import load_dotenv
-
+from simple_agent.clients import get_tavily, run_blocking
 from simple_agent.config import MODEL
 from simple_agent.financial_advisor.advisor_agent import financial_advisor_agent
 
-load_dotenv()
-
-_tavily_client = None
-
-
-def _get_tavily():
-    """Lazy-initialise the Tavily client so the API key is read at call time."""
-    global _tavily_client
-    if _tavily_client is None:
-        api_key = os.getenv("TAVILY_API_KEY")
-        if not api_key:
-            raise RuntimeError("TAVILY_API_KEY is not set in the environment.")
-        _tavily_client = TavilyClient(api_key=api_key)
-    return _tavily_client
-
 
-def search_web(query: str):
+async def search_web(query: str):
     """Searches the web for up-to-date information."""
-    tavily = _get_tavily()
-    response = tavily.search(query=query, search_depth="basic")
+    tavily = get_tavily()
+    response = await run_blocking(tavily.search, query=query, search_depth="basic")
     return response['results']
 
 
 def get_current_time() -> dict:
     """Returns the current date and time"""
     now = datetime.now()
-    formattted_time = now.strftime("%Y-%m-%d %H:%M:%S")
+    formattted_time = f"{now.year}-{now.month:02d}-{now.day:02d} {now.hour:02d}:{now.minute:02d}:{now.second:02d}"
     return {"current_time": formattted_time}
 
 
@@ -48,6 +31,6 @@ root_agent = Agent(
         'For any questions about stocks, mutual funds, investments, portfolio, '
         'or financial markets, delegate to the financial_advisor_agent.'
     ),
-    tools=[search_web, get_current_time],
+    tools=[FunctionTool(search_web), FunctionTool(get_current_time)],
     sub_agents=[financial_advisor_agent],
 )
@@ -0,0 +1,211 @@
+"""
+Small TTL cache shared by the agent tools.
+
+Market data (prices, NAVs, the AMFI scheme list) changes at most a few
+times a day, but the tools are called many times per conversation.
+Decorating a fetch helper with ``ttl_cache`` serves repeat calls from
+memory until the entry expires. Tools that return JSON-friendly dicts can
+also persist entries under ``CACHE_DIR`` so they survive a restart.
+
+Failed fetches (functions returning ``None``) are never cached, so a
+transient network error does not stick around for the whole TTL. Error
+dicts (``{"error": ...}``) are only cached when ``error_seconds`` is given,
+which stops a bad ticker from being re-fetched on every call.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import threading
+import time
+from datetime import date
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
+
+# Default time-to-live values (seconds)
+PRICE_TTL = 60 * 60  # 1 hour for quotes and price / NAV series
+FUNDAMENTALS_TTL = 24 * 60 * 60  # 24 hours for financial statements
+SCHEME_LIST_TTL = 24 * 60 * 60  # 24 hours for the AMFI scheme list (published daily)
+ERROR_TTL = 60  # 1 minute for error responses
+
+# Where persistent cache entries are written, one directory per function
+CACHE_DIR = Path("~/.cache/google_agent").expanduser()
+
+# The oldest entries are deleted once CACHE_DIR grows past this size;
+# the check runs at most once per PRUNE_INTERVAL seconds
+CACHE_MAX_BYTES = 500 * 1024 * 1024
+PRUNE_INTERVAL = 60 * 60
+
+_prune_lock = threading.Lock()
+_last_prune = None
+
+
+def _json_default(obj):
+    # NumPy scalars and arrays, for the stdlib fallback
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def to_json(value) -> bytes:
+    """Serialize a tool result to JSON bytes, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(value, default=_json_default).encode()
+
+
+def _is_error(value) -> bool:
+    return isinstance(value, dict) and "error" in value
+
+
+def _disk_path(func, key) -> Path:
+    digest = hashlib.md5(repr(key).encode()).hexdigest()
+    return CACHE_DIR / func.__name__ / f"{digest}.json"
+
+
+def _read_disk(path: Path, seconds: float):
+    """Return (age, value) for a fresh entry on disk, or None."""
+    try:
+        with open(path, "rb") as f:
+            entry = orjson.loads(f.read()) if orjson is not None else json.load(f)
+        age = time.time() - entry["fetched_at"]
+        if 0 <= age < seconds:
+            return age, entry["value"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_disk(path: Path, value) -> None:
+    """Write an entry atomically; the cache is best-effort, so failures are ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(to_json({"fetched_at": time.time(), "value": value}))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _prune_disk() -> None:
+    """Delete the least recently written entries while CACHE_DIR exceeds CACHE_MAX_BYTES."""
+    global _last_prune
+    with _prune_lock:
+        now = time.monotonic()
+        if _last_prune is not None and now - _last_prune < PRUNE_INTERVAL:
+            return
+        _last_prune = now
+
+        files = []
+        for path in CACHE_DIR.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= CACHE_MAX_BYTES:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+
+
+def ttl_cache(
+    seconds: float,
+    maxsize: int = 256,
+    error_seconds: float | None = None,
+    persist: bool = False,
+    daily: bool = False,
+):
+    """Cache a function's results for ``seconds``.
+
+    The cache key is built from the bound arguments, with defaults filled
+    in, so ``f("a")``, ``f(x="a")`` and ``f("a", <default>)`` share one
+    entry; the arguments must be hashable. When ``maxsize`` entries are stored the oldest
+    entry is evicted. Error dicts are cached for ``error_seconds`` (not at
+    all by default). With ``persist=True`` successful results are also
+    written to ``CACHE_DIR`` as JSON and read back on a memory miss. With
+    ``daily=True`` the current date is part of the key, so entries also
+    expire at midnight. The wrapped function gains a ``cache_clear()``
+    method (memory only).
+    """
+
+    def decorator(func):
+        entries = {}  # key -> (expires_at, value)
+        lock = threading.Lock()
+        signature = inspect.signature(func)
+        var_keyword = next(
+            (name for name, param in signature.parameters.items() if param.kind is param.VAR_KEYWORD),
+            None,
+        )
+
+        def make_key(args, kwargs):
+            # Normalize how the call was written (positional vs keyword, defaults)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            if var_keyword is not None:
+                arguments = {**arguments, var_keyword: tuple(sorted(arguments[var_keyword].items()))}
+            return tuple(arguments.items())
+
+        def store(key, expires_at, value):
+            with lock:
+                entries.pop(key, None)
+                if len(entries) >= maxsize:
+                    # dicts keep insertion order, so the first key is the oldest
+                    entries.pop(next(iter(entries)))
+                entries[key] = (expires_at, value)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            if daily:
+                key += (date.today().isoformat(),)
+            now = time.monotonic()
+            with lock:
+                hit = entries.get(key)
+                if hit is not None and hit[0] > now:
+                    return hit[1]
+
+            if persist:
+                on_disk = _read_disk(_disk_path(func, key), seconds)
+                if on_disk is not None:
+                    age, value = on_disk
+                    store(key, now + seconds - age, value)
+                    return value
+
+            value = func(*args, **kwargs)
+            if value is None:
+                return value
+
+            if _is_error(value):
+                if error_seconds:
+                    store(key, now + error_seconds, value)
+                return value
+
+            store(key, now + seconds, value)
+            if persist:
+                _write_disk(_disk_path(func, key), value)
+                _prune_disk()
+            return value
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -0,0 +1,162 @@
+"""
+Shared network clients for the agent tools.
+
+The root agent and the financial advisor tools all talk to the same few
+services (Tavily, AMFI via mftool, Yahoo Finance via yfinance). Instead of each module building its own
+client -- and its own requests.Session -- the getters below create a single
+instance on first use and hand it to every caller. Parallel tool calls then
+reuse pooled keep-alive connections rather than opening new TLS sessions.
+
+Clients (and the heavy mftool import) are created lazily, so importing the
+agent performs no network I/O on the importing thread. The one exception is
+``warm_up``, which the stock tools start at import to fetch Yahoo's cookie
+and crumb in the background.
+
+All of these clients are synchronous. Async tools hand their blocking calls
+to ``run_blocking`` so that ADK can run several tool calls concurrently.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from tavily import TavilyClient
+from dotenv import load_dotenv
+
+from simple_agent.cache import PRICE_TTL, ttl_cache
+
+if TYPE_CHECKING:
+    import yfinance as yf
+    from mftool import Mftool
+
+load_dotenv()
+
+# Keep-alive connections per host; sized for concurrent tool calls
+POOL_SIZE = 20
+
+# Retry transient failures and rate limiting with a short backoff
+RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+
+# Any liquid symbol works; requesting it makes yfinance fetch its cookie and crumb
+WARMUP_SYMBOL = "^NSEI"
+
+# Worker threads that run blocking client calls on behalf of async tools
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="agent-io")
+
+# One lock per client: building the Mftool downloads the whole AMFI NAV
+# file, and that must not hold up callers of the other getters
+_tavily_lock = threading.Lock()
+_mftool_lock = threading.Lock()
+_yf_session_lock = threading.Lock()
+_tavily_client = None
+_mftool = None
+_yf_session = None
+
+
+def _use_connection_pool(session: requests.Session) -> requests.Session:
+    """Mount a larger keep-alive connection pool (with retries) on a requests session."""
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=RETRY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_tavily() -> TavilyClient:
+    """Return the shared Tavily client, reading the API key on first use."""
+    global _tavily_client
+    with _tavily_lock:
+        if _tavily_client is None:
+            api_key = os.getenv("TAVILY_API_KEY")
+            if not api_key:
+                raise RuntimeError("TAVILY_API_KEY is not set in the environment.")
+            client = TavilyClient(api_key=api_key)
+            _use_connection_pool(client.session)
+            _tavily_client = client
+    return _tavily_client
+
+
+def get_mftool() -> "Mftool":
+    """Return the shared Mftool instance.
+
+    mftool's NAV cache is disabled (it keeps NAVs for a day); freshness is
+    controlled by the TTL caches in the tool modules instead. Its scheme
+    list cache stays on: Mftool() downloads the whole AMFI file to fill it,
+    and the first scheme list lookup reuses that download.
+    """
+    global _mftool
+    with _mftool_lock:
+        if _mftool is None:
+            from mftool import Mftool
+
+            mf = Mftool()
+            mf._cache.disable()
+            _use_connection_pool(mf._session)
+            _mftool = mf
+    return _mftool
+
+
+def get_yf_session():
+    """Return the HTTP session shared by every yfinance Ticker.
+
+    Without one, each Ticker builds its own session. yfinance prefers a
+    curl_cffi session impersonating a browser (Yahoo throttles other TLS
+    fingerprints); a pooled requests session is the fallback when curl_cffi
+    is not installed.
+    """
+    global _yf_session
+    with _yf_session_lock:
+        if _yf_session is None:
+            try:
+                from curl_cffi import requests as curl_requests
+            except ImportError:
+                session = _use_connection_pool(requests.Session())
+                session.headers["User-Agent"] = "Mozilla/5.0 (compatible; google-agent)"
+            else:
+                session = curl_requests.Session(impersonate="chrome")
+            _yf_session = session
+    return _yf_session
+
+
+@ttl_cache(PRICE_TTL)
+def get_ticker(symbol: str) -> "yf.Ticker":
+    """Return a shared yfinance Ticker for ``symbol``.
+
+    A Ticker keeps per-symbol state (exchange timezone, info, financials), so
+    repeat queries for the same symbol reuse one instance. Entries expire after an hour so the Ticker's
+    own caches never serve stale data for longer than that.
+    """
+    import yfinance as yf
+
+    return yf.Ticker(symbol, session=get_yf_session())
+
+
+def warm_up() -> None:
+    """Fetch Yahoo's cookie and crumb on a background thread.
+
+    yfinance does this handshake on the first request in a process, which
+    otherwise stalls the first stock tool call. Failures are ignored; the
+    first real request simply retries the handshake. Set YF_WARMUP=0 to
+    disable it (e.g. when working offline).
+    """
+    if os.getenv("YF_WARMUP", "1") == "0":
+        return
+
+    def run():
+        try:
+            get_ticker(WARMUP_SYMBOL).fast_info.last_price
+        except Exception:
+            pass
+
+    threading.Thread(target=run, name="yf-warmup", daemon=True).start()
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking call on the shared worker pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
@@ -10,21 +10,28 @@ Metrics calculated:
   - Rolling returns
 """
 
-import numpy as np
-import pandas as pd
-import yfinance as yf
-from mftool import Mftool
+import math
+from typing import TYPE_CHECKING
+
+from simple_agent.cache import PRICE_TTL, ttl_cache
+from simple_agent.clients import get_mftool, get_ticker, run_blocking
+
+# numpy and pandas are imported inside the functions that use them,
+# so importing the agent stays fast for queries that never run an analysis.
+if TYPE_CHECKING:
+    import pandas as pd
 
 # India's approximate risk-free rate (10-year government bond yield)
 RISK_FREE_RATE = 0.07
 
-mf = Mftool()
+TRADING_DAYS_PER_YEAR = 252
 
 
-def _get_stock_prices(symbol: str, years: int = 5) -> pd.Series | None:
-    """Fetch closing price series for a stock from yfinance."""
+@ttl_cache(PRICE_TTL)
+def _get_stock_prices(symbol: str, years: int = 5) -> "pd.Series | None":
+    """Fetch closing price series for a stock from yfinance (cached for an hour)."""
     try:
-        ticker = yf.Ticker(symbol)
+        ticker = get_ticker(symbol)
         period = f"{years}y" if years <= 10 else "max"
         hist = ticker.history(period=period)
         if hist.empty:
@@ -34,19 +41,27 @@ def _get_stock_prices(symbol: str, years: int = 5) -> pd.Series | None:
         return None
 
 
-def _get_mf_navs(scheme_code: str) -> pd.Series | None:
-    """Fetch historical NAV series for a mutual fund from AMFI."""
+@ttl_cache(PRICE_TTL)
+def _get_mf_navs(scheme_code: str, years: int = 5) -> "pd.Series | None":
+    """Fetch the last ``years`` of NAVs for a mutual fund from AMFI (cached for an hour)."""
+    import pandas as pd
+
     try:
-        history = mf.get_scheme_historical_nav(scheme_code, as_Dataframe=True)
+        history = get_mftool().get_scheme_historical_nav(scheme_code, as_Dataframe=True)
         if history is None or history.empty:
             return None
 
-        # mftool returns nav as string; convert to float
-        nav_series = history["nav"].astype(float)
-
         # Convert index to datetime if it isn't already
-        if not isinstance(nav_series.index, pd.DatetimeIndex):
-            nav_series.index = pd.to_datetime(nav_series.index, format="%d-%m-%Y", errors="coerce")
+        dates = history.index
+        if not isinstance(dates, pd.DatetimeIndex):
+            dates = pd.to_datetime(dates, format="%d-%m-%Y", errors="coerce")
+
+        # mftool returns the full history (often 10-20 years); keep the same
+        # window yfinance returns for stocks before converting any NAVs
+        in_window = dates >= dates.max() - pd.DateOffset(years=years)
+
+        # mftool returns nav as string; convert to float
+        nav_series = pd.Series(history["nav"].to_numpy()[in_window], index=dates[in_window]).astype(float)
 
         nav_series = nav_series.dropna()
         nav_series = nav_series.sort_index()
@@ -55,71 +70,144 @@ def _get_mf_navs(scheme_code: str) -> pd.Series | None:
         return None
 
 
-def _calculate_cagr(prices: pd.Series, years: int) -> float | None:
-    """Calculate CAGR over the last N years from a price series."""
-    if prices is None or len(prices) < 2:
-        return None
-
-    trading_days = years * 252
-    if len(prices) < trading_days:
-        # Use whatever data is available
-        actual_days = len(prices)
-        actual_years = actual_days / 252
-    else:
-        actual_years = years
-        prices = prices.iloc[-trading_days:]
-
-    start_val = float(prices.iloc[0])
-    end_val = float(prices.iloc[-1])
+# Order of the values returned by _metrics_core, and the factor applied
+# before rounding (percentages for everything except the Sharpe ratio)
+_METRIC_NAMES = ("cagr_1y", "cagr_3y", "cagr_5y", "volatility", "sharpe", "max_drawdown")
+_METRIC_SCALES = (100, 100, 100, 100, 1, 100)
 
-    if start_val <= 0:
-        return None
 
-    cagr = (end_val / start_val) ** (1 / actual_years) - 1
-    return round(cagr * 100, 2)
+def _metrics_loop(arr):
+    """Single-pass metric kernel written as plain loops so Numba can compile it.
 
+    Returns the raw (unrounded) values in _METRIC_NAMES order, with NaN for
+    metrics that cannot be computed from the available data.
+    """
+    n = arr.shape[0]
+    cagr_1y = cagr_3y = cagr_5y = math.nan
+    volatility = sharpe = max_drawdown = math.nan
+    if n < 2:
+        return cagr_1y, cagr_3y, cagr_5y, volatility, sharpe, max_drawdown
+
+    # CAGR: use the last N years, or whatever data is available if shorter
+    end_val = arr[n - 1]
+    for years in (1, 3, 5):
+        trading_days = years * TRADING_DAYS_PER_YEAR
+        if n < trading_days:
+            start_val = arr[0]
+            actual_years = n / TRADING_DAYS_PER_YEAR
+        else:
+            start_val = arr[n - trading_days]
+            actual_years = years
+        cagr = math.nan
+        if start_val > 0:
+            cagr = (end_val / start_val) ** (1 / actual_years) - 1
+        if years == 1:
+            cagr_1y = cagr
+        elif years == 3:
+            cagr_3y = cagr
+        else:
+            cagr_5y = cagr
+
+    # Running peak for drawdown, Welford's running mean/variance for returns
+    peak = arr[0]
+    max_drawdown = 0.0
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(1, n):
+        price = arr[i]
+        if price > peak or math.isnan(peak):
+            peak = price
+        drawdown = (price - peak) / peak
+        if drawdown < max_drawdown:
+            max_drawdown = drawdown
+
+        daily_return = (price - arr[i - 1]) / arr[i - 1]
+        if not math.isnan(daily_return):
+            count += 1
+            delta = daily_return - mean
+            mean += delta / count
+            m2 += delta * (daily_return - mean)
+
+    if n >= 30 and count >= 2:
+        daily_std = math.sqrt(m2 / (count - 1))
+        volatility = daily_std * math.sqrt(TRADING_DAYS_PER_YEAR)
+        if daily_std != 0:
+            sharpe = (mean * TRADING_DAYS_PER_YEAR - RISK_FREE_RATE) / volatility
+
+    return cagr_1y, cagr_3y, cagr_5y, volatility, sharpe, max_drawdown
+
+
+def _metrics_vectorized(arr):
+    """NumPy implementation of _metrics_loop, used when Numba is not installed."""
+    import numpy as np
+
+    n = len(arr)
+    if n < 2:
+        return (np.nan,) * len(_METRIC_NAMES)
+
+    cagrs = []
+    for years in (1, 3, 5):
+        trading_days = years * TRADING_DAYS_PER_YEAR
+        if n < trading_days:
+            start_val, actual_years = arr[0], n / TRADING_DAYS_PER_YEAR
+        else:
+            start_val, actual_years = arr[-trading_days], years
+        cagrs.append((arr[-1] / start_val) ** (1 / actual_years) - 1 if start_val > 0 else np.nan)
 
-def _calculate_volatility(prices: pd.Series) -> float | None:
-    """Calculate annualized volatility from a price series."""
-    if prices is None or len(prices) < 30:
-        return None
+    # fmax/nanmin skip missing prices, as the loop's comparisons do
+    running_max = np.fmax.accumulate(arr)
+    max_drawdown = np.nanmin((arr - running_max) / running_max)
 
-    daily_returns = prices.pct_change().dropna()
-    if daily_returns.empty:
-        return None
+    volatility = sharpe = np.nan
+    daily_returns = np.diff(arr) / arr[:-1]
+    daily_returns = daily_returns[~np.isnan(daily_returns)]
+    if n >= 30 and daily_returns.size >= 2:
+        daily_std = np.std(daily_returns, ddof=1)
+        volatility = daily_std * np.sqrt(TRADING_DAYS_PER_YEAR)
+        if daily_std != 0:
+            sharpe = (np.mean(daily_returns) * TRADING_DAYS_PER_YEAR - RISK_FREE_RATE) / volatility
 
-    annualized_vol = float(daily_returns.std() * np.sqrt(252))
-    return round(annualized_vol * 100, 2)
+    return (*cagrs, volatility, sharpe, max_drawdown)
 
 
-def _calculate_sharpe(prices: pd.Series) -> float | None:
-    """Calculate annualized Sharpe ratio."""
-    if prices is None or len(prices) < 30:
-        return None
+_metrics_core = None
 
-    daily_returns = prices.pct_change().dropna()
-    if daily_returns.empty or daily_returns.std() == 0:
-        return None
 
-    annualized_return = float(daily_returns.mean() * 252)
-    annualized_vol = float(daily_returns.std() * np.sqrt(252))
+def _get_metrics_core():
+    """Return the metric kernel, compiling it with Numba on first use when installed."""
+    global _metrics_core
+    if _metrics_core is None:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional; the NumPy implementation is used instead
+            _metrics_core = _metrics_vectorized
+        else:
+            # cache=True stores the compiled kernel on disk so only the very first
+            # run pays the compile cost. fastmath is enabled without the
+            # no-NaN/no-inf flags, which would let LLVM drop the kernel's NaN checks.
+            _metrics_core = njit(cache=True, fastmath={"reassoc", "contract", "arcp", "nsz", "afn"})(_metrics_loop)
+    return _metrics_core
 
-    sharpe = (annualized_return - RISK_FREE_RATE) / annualized_vol
-    return round(sharpe, 2)
 
+def _compute_all_metrics(prices: "pd.Series") -> dict:
+    """Calculate every risk/return metric from a price series.
 
-def _calculate_max_drawdown(prices: pd.Series) -> float | None:
-    """Calculate maximum drawdown (worst peak-to-trough decline)."""
-    if prices is None or len(prices) < 2:
-        return None
+    Returns CAGR for 1Y, 3Y and 5Y, annualized volatility, Sharpe ratio and
+    maximum drawdown (percentages rounded to 2 decimals). A metric is None
+    when there is not enough data to compute it.
+    """
+    import numpy as np
 
-    cumulative_max = prices.cummax()
-    drawdowns = (prices - cumulative_max) / cumulative_max
-    max_dd = float(drawdowns.min())
-    return round(max_dd * 100, 2)
+    raw = np.array(_get_metrics_core()(prices.to_numpy(dtype=np.float64)))
+    rounded = np.round(raw * np.array(_METRIC_SCALES), 2).tolist()
+    return {
+        name: None if math.isnan(value) else value
+        for name, value in zip(_METRIC_NAMES, rounded)
+    }
 
 
-def analyze_investment(identifier: str, investment_type: str = "stock") -> dict:
+async def analyze_investment(identifier: str, investment_type: str = "stock") -> dict:
     """Calculates comprehensive risk and return metrics for a stock or mutual fund.
 
     This tool computes CAGR (1Y, 3Y, 5Y), annualized volatility, Sharpe ratio,
@@ -138,10 +226,10 @@ def analyze_investment(identifier: str, investment_type: str = "stock") -> dict:
     """
     try:
         if investment_type == "stock":
-            prices = _get_stock_prices(identifier, years=5)
+            prices = await run_blocking(_get_stock_prices, identifier, years=5)
             label = f"Stock: {identifier}"
         elif investment_type == "mutual_fund":
-            prices = _get_mf_navs(identifier)
+            prices = await run_blocking(_get_mf_navs, identifier, years=5)
             label = f"Mutual Fund (scheme code: {identifier})"
         else:
             return {"error": f"Invalid investment_type '{investment_type}'. Use 'stock' or 'mutual_fund'."}
@@ -149,13 +237,10 @@ def analyze_investment(identifier: str, investment_type: str = "stock") -> dict:
         if prices is None or len(prices) < 10:
             return {"error": f"Insufficient historical data for '{identifier}'. Verify the identifier and try again."}
 
-        # Calculate metrics
-        cagr_1y = _calculate_cagr(prices, 1)
-        cagr_3y = _calculate_cagr(prices, 3)
-        cagr_5y = _calculate_cagr(prices, 5)
-        volatility = _calculate_volatility(prices)
-        sharpe = _calculate_sharpe(prices)
-        max_drawdown = _calculate_max_drawdown(prices)
+        # Calculate metrics. The first call imports Numba and compiles (or loads)
+        # the kernel, which takes the better part of a second, so it runs on
+        # the worker pool rather than on the event loop.
+        metrics = await run_blocking(_compute_all_metrics, prices)
 
         result = {
             "identifier": identifier,
@@ -166,16 +251,16 @@ def analyze_investment(identifier: str, investment_type: str = "stock") -> dict:
             "data_end_date": prices.index[-1].strftime("%Y-%m-%d"),
             "latest_value": round(float(prices.iloc[-1]), 2),
             "metrics": {
-                "cagr_1y_percent": cagr_1y if cagr_1y is not None else "Insufficient data",
-                "cagr_3y_percent": cagr_3y if cagr_3y is not None else "Insufficient data",
-                "cagr_5y_percent": cagr_5y if cagr_5y is not None else "Insufficient data",
-                "annualized_volatility_percent": volatility if volatility is not None else "Insufficient data",
-                "sharpe_ratio": sharpe if sharpe is not None else "Insufficient data",
-                "max_drawdown_percent": max_drawdown if max_drawdown is not None else "Insufficient data",
+                "cagr_1y_percent": metrics["cagr_1y"] if metrics["cagr_1y"] is not None else "Insufficient data",
+                "cagr_3y_percent": metrics["cagr_3y"] if metrics["cagr_3y"] is not None else "Insufficient data",
+                "cagr_5y_percent": metrics["cagr_5y"] if metrics["cagr_5y"] is not None else "Insufficient data",
+                "annualized_volatility_percent": metrics["volatility"] if metrics["volatility"] is not None else "Insufficient data",
+                "sharpe_ratio": metrics["sharpe"] if metrics["sharpe"] is not None else "Insufficient data",
+                "max_drawdown_percent": metrics["max_drawdown"] if metrics["max_drawdown"] is not None else "Insufficient data",
             },
             "assumptions": {
                 "risk_free_rate_percent": RISK_FREE_RATE * 100,
-                "trading_days_per_year": 252,
+                "trading_days_per_year": TRADING_DAYS_PER_YEAR,
             },
             "disclaimer": "Past performance is not indicative of future results. This is for informational purposes only.",
         }
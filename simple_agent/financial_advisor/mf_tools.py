@@ -7,31 +7,82 @@ mutual fund schemes. Examples:
   - 120503: SBI Small Cap Fund - Direct Plan - Growth
 """
 
-import os
+import asyncio
+import re
+from collections import defaultdict
 from datetime import datetime
+from typing import NamedTuple
 
-import pandas as pd
-from mftool import Mftool
-from tavily import TavilyClient
-from dotenv import load_dotenv
+from simple_agent.cache import SCHEME_LIST_TTL, ttl_cache
+from simple_agent.clients import get_mftool, get_tavily, run_blocking
 
-load_dotenv()
 
-_tavily_client = None
+@ttl_cache(SCHEME_LIST_TTL, maxsize=1)
+def _get_scheme_codes() -> dict | None:
+    """Fetch the full AMFI scheme code -> name mapping (cached for a day)."""
+    mf = get_mftool()
+    # The first call is answered from the list Mftool() fetched when it was
+    # created. Clearing mftool's copy afterwards means the next refresh, once
+    # this TTL expires, downloads a fresh list instead of a week-old one.
+    all_schemes = mf.get_scheme_codes()
+    mf.clear_cache()
+    if not all_schemes:
+        return None
+    # mftool validates codes against the list it loaded when it was created
+    mf._scheme_codes = all_schemes.keys()
+    return all_schemes
 
 
-def _get_tavily():
-    """Lazy-initialise the Tavily client so the API key is read at call time."""
-    global _tavily_client
-    if _tavily_client is None:
-        api_key = os.getenv("TAVILY_API_KEY")
-        if not api_key:
-            raise RuntimeError("TAVILY_API_KEY is not set in the environment.")
-        _tavily_client = TavilyClient(api_key=api_key)
-    return _tavily_client
+# Scheme names are tokenised into runs of lowercase letters and digits
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
 
 
-def search_mutual_fund(query: str) -> dict:
+class _SchemeIndex(NamedTuple):
+    """Inverted index over the AMFI scheme names."""
+
+    schemes: list[tuple[str, str, str]]  # (code, name, lowercased name) in AMFI order
+    order: dict[str, int]  # scheme code -> position in ``schemes``
+    tokens: dict[str, set[str]]  # name token -> scheme codes containing it
+
+
+@ttl_cache(SCHEME_LIST_TTL, maxsize=1)
+def _get_scheme_index() -> _SchemeIndex | None:
+    """Build the search index for the cached scheme list.
+
+    Names are lowercased here, once per scheme list, rather than on every query.
+    """
+    all_schemes = _get_scheme_codes()
+    if not all_schemes:
+        return None
+
+    schemes = [(code, name, name.lower()) for code, name in all_schemes.items()]
+    order = {}
+    tokens = defaultdict(set)
+    for position, (code, _, name_lower) in enumerate(schemes):
+        order[code] = position
+        for token in _TOKEN_RE.findall(name_lower):
+            tokens[token].add(code)
+    return _SchemeIndex(schemes, order, dict(tokens))
+
+
+def _codes_containing(term: str, index: _SchemeIndex) -> set[str] | None:
+    """Return the codes of schemes whose name contains ``term``.
+
+    A purely alphanumeric term can only occur inside a single name token, so
+    scanning the (much smaller) token vocabulary is equivalent to scanning
+    every scheme name. Returns None for terms with punctuation, which the
+    index cannot answer.
+    """
+    if _TOKEN_RE.fullmatch(term) is None:
+        return None
+    codes = set()
+    for token, token_codes in index.tokens.items():
+        if term in token:
+            codes |= token_codes
+    return codes
+
+
+async def search_mutual_fund(query: str) -> dict:
     """Searches for Indian mutual fund schemes by name or fund house.
 
     Args:
@@ -44,20 +95,35 @@ def search_mutual_fund(query: str) -> dict:
         Use the scheme code with get_mf_details() to fetch detailed data.
     """
     try:
-        # Fresh instance each call to avoid stale cached data
-        mf = Mftool()
-        all_schemes = mf.get_scheme_codes()
+        # A cold index downloads the AMFI scheme list; keep that off the event loop
+        index = await run_blocking(_get_scheme_index)
 
-        if not all_schemes:
+        if not index:
             return {"error": "Unable to fetch scheme list from AMFI."}
 
         query_lower = query.lower()
         query_terms = query_lower.split()
 
+        # Narrow down to candidate schemes with the token index, then check any
+        # terms the index could not answer against the candidate names only.
+        candidates = None
+        unindexed_terms = []
+        for term in query_terms:
+            codes = _codes_containing(term, index)
+            if codes is None:
+                unindexed_terms.append(term)
+            else:
+                candidates = codes if candidates is None else candidates & codes
+
+        if candidates is None:
+            candidate_schemes = index.schemes
+        else:
+            positions = sorted(index.order[code] for code in candidates)
+            candidate_schemes = [index.schemes[position] for position in positions]
+
         matches = {}
-        for code, name in all_schemes.items():
-            name_lower = name.lower()
-            if all(term in name_lower for term in query_terms):
+        for code, name, name_lower in candidate_schemes:
+            if all(term in name_lower for term in unindexed_terms):
                 matches[code] = name
 
         if not matches:
@@ -79,7 +145,7 @@ def search_mutual_fund(query: str) -> dict:
         return {"error": f"Failed to search mutual funds: {str(e)}"}
 
 
-def get_mf_details(scheme_code: str) -> dict:
+async def get_mf_details(scheme_code: str) -> dict:
     """Fetches current NAV, scheme info, and recent NAV history for a mutual fund.
 
     Args:
@@ -91,19 +157,37 @@ def get_mf_details(scheme_code: str) -> dict:
         A dictionary with scheme name, current NAV, fund house, scheme type/category,
         and the last 30 historical NAV entries.
     """
+    import pandas as pd
+
     try:
-        # Fresh instance each call to avoid stale cached data
-        mf = Mftool()
+        mf = await run_blocking(get_mftool)
 
-        # Get current scheme quote
-        quote = mf.get_scheme_quote(scheme_code)
+        # The current quote and the NAV history are independent requests
+        quote, history = await asyncio.gather(
+            run_blocking(mf.get_scheme_quote, scheme_code),
+            run_blocking(mf.get_scheme_historical_nav, scheme_code, as_Dataframe=True),
+            return_exceptions=True,
+        )
 
-        if not quote or "error" in str(quote).lower():
-            return {"error": f"No data found for scheme code '{scheme_code}'. Verify the code using search_mutual_fund()."}
+        cached_name = None
+        if isinstance(quote, Exception) or not quote or "error" in str(quote).lower():
+            # Only now is the scheme list needed, to supply the scheme name. It
+            # is usually cached; on a miss it downloads the full AMFI file.
+            try:
+                all_schemes = await run_blocking(_get_scheme_codes)
+            except Exception:
+                all_schemes = None
+            if all_schemes:
+                cached_name = all_schemes.get(scheme_code)
+            if cached_name is None:
+                if isinstance(quote, Exception):
+                    raise quote
+                return {"error": f"No data found for scheme code '{scheme_code}'. Verify the code using search_mutual_fund()."}
+            quote = {}
 
         result = {
             "scheme_code": scheme_code,
-            "scheme_name": quote.get("scheme_name", "N/A"),
+            "scheme_name": quote.get("scheme_name") or cached_name or "N/A",
             "fund_house": quote.get("fund_house", "N/A"),
             "scheme_type": quote.get("scheme_type", "N/A"),
             "scheme_category": quote.get("scheme_category", "N/A"),
@@ -112,9 +196,10 @@ def get_mf_details(scheme_code: str) -> dict:
             "data_fetched_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         }
 
-        # Fetch historical NAV data
+        # Historical NAV data
         try:
-            history = mf.get_scheme_historical_nav(scheme_code, as_Dataframe=True)
+            if isinstance(history, Exception):
+                raise history
             if history is not None and not history.empty:
                 # Ensure index is datetime and sort chronologically (oldest first)
                 if not hasattr(history.index, "year"):
@@ -123,13 +208,14 @@ def get_mf_details(scheme_code: str) -> dict:
 
                 # Show the most recent 30 entries (newest at end)
                 recent = history.tail(30)
-                nav_history = []
-                for date_val, row in recent.iterrows():
-                    nav_history.append({
-                        "date": date_val.strftime("%Y-%m-%d") if hasattr(date_val, "strftime") else str(date_val),
-                        "nav": str(row.get("nav", "N/A")),
-                    })
-                result["recent_nav_history"] = nav_history
+                if isinstance(recent.index, pd.DatetimeIndex):
+                    recent_dates = recent.index.strftime("%Y-%m-%d")
+                else:
+                    recent_dates = recent.index.astype(str)
+                result["recent_nav_history"] = [
+                    {"date": date_str, "nav": str(nav)}
+                    for date_str, nav in zip(recent_dates, recent["nav"].to_numpy())
+                ]
                 result["total_nav_records"] = len(history)
                 result["history_start_date"] = history.index[0].strftime("%Y-%m-%d") if hasattr(history.index[0], "strftime") else str(history.index[0])
                 result["history_end_date"] = history.index[-1].strftime("%Y-%m-%d") if hasattr(history.index[-1], "strftime") else str(history.index[-1])
@@ -143,7 +229,7 @@ def get_mf_details(scheme_code: str) -> dict:
         return {"error": f"Failed to fetch details for scheme '{scheme_code}': {str(e)}"}
 
 
-def search_financial_news(query: str) -> dict:
+async def search_financial_news(query: str) -> dict:
     """Searches the web for financial news, market analysis, and investment information.
 
     Use this tool to find information not available from structured APIs, such as:
@@ -162,14 +248,15 @@ def search_financial_news(query: str) -> dict:
         A list of search results with titles, URLs, and content snippets.
     """
     try:
-        tavily = _get_tavily()
+        tavily = get_tavily()
 
         # Auto-append current year if no year is mentioned, to bias toward recent results
         current_year = str(datetime.now().year)
         if current_year not in query and str(int(current_year) - 1) not in query:
             query = f"{query} {current_year}"
 
-        response = tavily.search(
+        response = await run_blocking(
+            tavily.search,
             query=query,
             search_depth="advanced",
             include_domains=[
@@ -5,117 +5,540 @@ Ticker format:
   - NSE stocks: append .NS (e.g. RELIANCE.NS, TCS.NS, INFY.NS)
   - BSE stocks: append .BO (e.g. RELIANCE.BO)
   - Indices: ^NSEI (NIFTY 50), ^BSESN (SENSEX)
+
+The tools are async and run their blocking yfinance calls on the shared
+worker pool. Their cached synchronous implementations (_get_stock_quote
+and friends) also back the *_batch variants, which fetch several symbols
+concurrently and return a dict keyed by symbol. get_stock_history_columnar
+returns NumPy columns for Python callers instead of JSON-friendly records.
 """
 
-from datetime import datetime
+import asyncio
+import logging
+import math
+import numbers
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 
-import yfinance as yf
+from simple_agent.cache import ERROR_TTL, FUNDAMENTALS_TTL, PRICE_TTL, ttl_cache
+from simple_agent.clients import get_ticker, get_yf_session, run_blocking, warm_up
 
+logger = logging.getLogger(__name__)
 
-def get_stock_info(symbol: str) -> dict:
-    """Fetches company info and key fundamentals for an Indian stock.
+# Format of the data_fetched_at field
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-    Args:
-        symbol: NSE/BSE ticker symbol with exchange suffix.
-                Examples: 'RELIANCE.NS', 'TCS.NS', 'INFY.BO'.
-                Use .NS for NSE, .BO for BSE.
+# Calendar days covered by each yfinance history period
+_PERIOD_DAYS = {
+    "1mo": 31, "3mo": 92, "6mo": 183, "1y": 366, "2y": 731,
+    "5y": 1827, "10y": 3653, "max": float("inf"),
+}
 
-    Returns:
-        A dictionary containing company name, sector, industry, market cap,
-        P/E ratio, P/B ratio, EPS, dividend yield, 52-week high/low,
-        current price, and other key fundamentals.
+# Calendar days per trading day, with headroom for weekends and holidays,
+# and the shortest window requested so a long weekend never comes back empty
+_CALENDAR_DAYS_PER_TRADING_DAY = 1.8
+_MIN_WINDOW_DAYS = 10
+
+# quoteSummary modules that carry every field get_stock_info reads
+_INFO_MODULES = ["price", "summaryDetail", "defaultKeyStatistics", "assetProfile", "financialData"]
+
+# get_stock_quote numeric output key -> yfinance fast_info attribute. All of
+# these come from the price chart. market_cap is left out: fast_info derives
+# it from the share count (an extra request) and falls back to the full
+# Ticker.info when that is unknown, as it is for indices.
+_QUOTE_FIELDS = {
+    "current_price": "last_price",
+    "previous_close": "previous_close",
+    "open": "open",
+    "day_high": "day_high",
+    "day_low": "day_low",
+    "fifty_two_week_high": "year_high",
+    "fifty_two_week_low": "year_low",
+}
+
+# Yahoo's multi-symbol quote endpoint and the most symbols it takes per request
+_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+QUOTE_BATCH_SIZE = 20
+
+# get_quotes_async numeric output key -> field of the quote endpoint response
+_BATCH_QUOTE_FIELDS = {
+    "current_price": "regularMarketPrice",
+    "previous_close": "regularMarketPreviousClose",
+    "open": "regularMarketOpen",
+    "day_high": "regularMarketDayHigh",
+    "day_low": "regularMarketDayLow",
+    "fifty_two_week_high": "fiftyTwoWeekHigh",
+    "fifty_two_week_low": "fiftyTwoWeekLow",
+    "market_cap": "marketCap",
+}
+
+# Yahoo's fundamentals timeseries endpoint; it never returns more than
+# about four annual periods, whatever the start date
+_FUNDAMENTALS_URL = "https://query2.finance.yahoo.com/ws/fundamentals-timeseries/v1/finance/timeseries/{symbol}"
+_FUNDAMENTALS_START = 1483142400  # 2016-12-31 UTC
+
+# get_stock_financials fields: (output label, Yahoo timeseries key)
+_INCOME_FIELDS = (
+    ("Total Revenue", "TotalRevenue"),
+    ("Gross Profit", "GrossProfit"),
+    ("EBITDA", "EBITDA"),
+    ("Operating Income", "OperatingIncome"),
+    ("Net Income", "NetIncome"),
+    ("Basic EPS", "BasicEPS"),
+    ("Diluted EPS", "DilutedEPS"),
+)
+_BALANCE_FIELDS = (
+    ("Total Assets", "TotalAssets"),
+    ("Total Liabilities Net Minority Interest", "TotalLiabilitiesNetMinorityInterest"),
+    ("Total Debt", "TotalDebt"),
+    ("Cash And Cash Equivalents", "CashAndCashEquivalents"),
+    ("Stockholders Equity", "StockholdersEquity"),
+    ("Net Tangible Assets", "NetTangibleAssets"),
+)
+
+# get_stock_info text fields: (output key, info keys tried in order, default)
+_INFO_TEXT_FIELDS = (
+    ("name", ("shortName", "longName"), "N/A"),
+    ("sector", ("sector",), "N/A"),
+    ("industry", ("industry",), "N/A"),
+    ("currency", ("currency",), "INR"),
+)
+
+# get_stock_info numeric fields: (output key, info keys tried in order)
+_INFO_NUMERIC_FIELDS = (
+    ("current_price", ("currentPrice", "regularMarketPrice")),
+    ("previous_close", ("previousClose",)),
+    ("open", ("open",)),
+    ("day_high", ("dayHigh",)),
+    ("day_low", ("dayLow",)),
+    ("fifty_two_week_high", ("fiftyTwoWeekHigh",)),
+    ("fifty_two_week_low", ("fiftyTwoWeekLow",)),
+    ("market_cap", ("marketCap",)),
+    ("pe_ratio_trailing", ("trailingPE",)),
+    ("pe_ratio_forward", ("forwardPE",)),
+    ("pb_ratio", ("priceToBook",)),
+    ("eps_trailing", ("trailingEps",)),
+    ("eps_forward", ("forwardEps",)),
+    ("dividend_yield", ("dividendYield",)),
+    ("book_value", ("bookValue",)),
+    ("debt_to_equity", ("debtToEquity",)),
+    ("return_on_equity", ("returnOnEquity",)),
+    ("revenue", ("totalRevenue",)),
+    ("profit_margin", ("profitMargins",)),
+    ("beta", ("beta",)),
+    ("average_volume", ("averageVolume",)),
+)
+
+
+def _fetched_at() -> str:
+    """Timestamp for data_fetched_at; each tool call formats it exactly once."""
+    return datetime.now().strftime(_TIMESTAMP_FORMAT)
+
+
+def _n(value) -> float | None:
+    """Normalize a numeric field to a float, or None when missing or NaN.
+
+    Numeric fields are always a number or null, never the string "N/A".
+    """
+    if isinstance(value, bool) or not isinstance(value, numbers.Real):
+        return None
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+def _first_number(info: dict, aliases: tuple[str, ...]) -> float | None:
+    """Return the first of ``aliases`` that holds a usable number in ``info``."""
+    for alias in aliases:
+        value = _n(info.get(alias))
+        if value is not None:
+            return value
+    return None
+
+
+def _fetch_info(ticker) -> dict:
+    """Fetch the quoteSummary modules get_stock_info needs as one flat dict.
+
+    Ticker.info makes three requests (quoteSummary, the v7 quote endpoint
+    and a timeseries call for the PEG ratio); this makes one. It relies on
+    a private yfinance method, so Ticker.info is used if that goes away.
     """
     try:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        fetch = ticker._quote._fetch
+    except AttributeError:
+        return ticker.info
 
-        if not info or info.get("trailingPegRatio") is None and info.get("shortName") is None:
-            return {"error": f"No data found for symbol '{symbol}'. Verify the ticker and exchange suffix (.NS for NSE, .BO for BSE)."}
+    response = fetch(modules=_INFO_MODULES) or {}
+    results = (response.get("quoteSummary") or {}).get("result") or []
+    if not results:
+        return {}
+
+    # Each module is a dict of fields; merge them, first module wins on clashes
+    info = {}
+    for module in results[0].values():
+        if not isinstance(module, dict):
+            continue
+        for key, value in module.items():
+            if isinstance(value, dict) and "raw" in value:
+                value = value["raw"]
+            if value is not None and key not in info:
+                info[key] = value
+    return info
+
+
+@ttl_cache(PRICE_TTL, error_seconds=ERROR_TTL, persist=True)
+def _get_stock_quote(symbol: str) -> dict:
+    """Synchronous get_stock_quote; cached, and also used by get_stock_info."""
+    try:
+        fast_info = get_ticker(symbol).fast_info
+
+        if fast_info.last_price is None:
+            return {"error": f"No price data found for symbol '{symbol}'. Verify the ticker and exchange suffix (.NS for NSE, .BO for BSE)."}
 
         result = {
             "symbol": symbol,
-            "data_fetched_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            "name": info.get("shortName") or info.get("longName", "N/A"),
-            "sector": info.get("sector", "N/A"),
-            "industry": info.get("industry", "N/A"),
-            "currency": info.get("currency", "INR"),
-            "current_price": info.get("currentPrice") or info.get("regularMarketPrice", "N/A"),
-            "previous_close": info.get("previousClose", "N/A"),
-            "open": info.get("open", "N/A"),
-            "day_high": info.get("dayHigh", "N/A"),
-            "day_low": info.get("dayLow", "N/A"),
-            "fifty_two_week_high": info.get("fiftyTwoWeekHigh", "N/A"),
-            "fifty_two_week_low": info.get("fiftyTwoWeekLow", "N/A"),
-            "market_cap": info.get("marketCap", "N/A"),
-            "pe_ratio_trailing": info.get("trailingPE", "N/A"),
-            "pe_ratio_forward": info.get("forwardPE", "N/A"),
-            "pb_ratio": info.get("priceToBook", "N/A"),
-            "eps_trailing": info.get("trailingEps", "N/A"),
-            "eps_forward": info.get("forwardEps", "N/A"),
-            "dividend_yield": info.get("dividendYield", "N/A"),
-            "book_value": info.get("bookValue", "N/A"),
-            "debt_to_equity": info.get("debtToEquity", "N/A"),
-            "return_on_equity": info.get("returnOnEquity", "N/A"),
-            "revenue": info.get("totalRevenue", "N/A"),
-            "profit_margin": info.get("profitMargins", "N/A"),
-            "beta": info.get("beta", "N/A"),
-            "average_volume": info.get("averageVolume", "N/A"),
-            "description": (info.get("longBusinessSummary") or "N/A")[:500],
+            "data_fetched_at": _fetched_at(),
+            "currency": fast_info.currency or "N/A",
         }
+        for key, attr in _QUOTE_FIELDS.items():
+            result[key] = _n(getattr(fast_info, attr))
+        return result
+    except Exception as e:
+        return {"error": f"Failed to fetch stock quote for '{symbol}': {str(e)}"}
+
+
+@ttl_cache(PRICE_TTL, error_seconds=ERROR_TTL, persist=True)
+def _get_stock_info(symbol: str, include_fundamentals: bool = True) -> dict:
+    """Synchronous get_stock_info; cached, and also used by get_stock_info_batch."""
+    if not include_fundamentals:
+        return _get_stock_quote(symbol)
+
+    try:
+        ticker = get_ticker(symbol)
+        info = _fetch_info(ticker)
+
+        # Any of these identifies a real listing; check before building the result
+        if not info or ("shortName" not in info and "longName" not in info and "regularMarketPrice" not in info):
+            return {"error": f"No data found for symbol '{symbol}'. Verify the ticker and exchange suffix (.NS for NSE, .BO for BSE)."}
+
+        result = {"symbol": symbol, "data_fetched_at": _fetched_at()}
+        result.update({
+            key: next((info[alias] for alias in aliases if info.get(alias)), default)
+            for key, aliases, default in _INFO_TEXT_FIELDS
+        })
+        result.update({key: _first_number(info, aliases) for key, aliases in _INFO_NUMERIC_FIELDS})
+        description = info.get("longBusinessSummary") or ""
+        result["description"] = description[:500] if description else "N/A"
         return result
     except Exception as e:
         return {"error": f"Failed to fetch stock info for '{symbol}': {str(e)}"}
 
 
-def get_stock_history(symbol: str, period: str = "1y") -> dict:
-    """Fetches historical OHLCV (Open, High, Low, Close, Volume) price data for a stock.
+def _round_prices_loop(prices, out):
+    """Round a 2-D array of prices to 2 decimals into ``out``.
 
-    Args:
-        symbol: NSE/BSE ticker symbol with exchange suffix.
-                Examples: 'RELIANCE.NS', 'TCS.NS', 'INFY.BO'.
-        period: Time period for historical data.
-                Valid values: '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'max'.
-                Defaults to '1y'.
+    Written as plain loops so Numba can compile it. round() of a float
+    rounds half to even, the same as np.round.
+    """
+    rows, cols = prices.shape
+    for i in range(rows):
+        for j in range(cols):
+            price = prices[i, j]
+            out[i, j] = price if math.isnan(price) else round(price * 100.0) / 100.0
 
-    Returns:
-        A dictionary with the stock symbol, period, number of data points,
-        and a list of recent price records (last 30 entries) with date, open,
-        high, low, close, and volume.
+
+def _round_prices_vectorized(prices, out):
+    """NumPy implementation of _round_prices_loop, used when Numba is not installed."""
+    import numpy as np
+
+    # Scale, round half to even, scale back -- written into out with no
+    # temporaries. Dividing (not multiplying by 0.01) keeps results like 1.23 exact.
+    np.multiply(prices, 100.0, out=out)
+    np.rint(out, out=out)
+    np.divide(out, 100.0, out=out)
+
+
+_round_prices = None
+
+
+def _get_round_prices():
+    """Return the rounding kernel, compiling it with Numba on first use when installed."""
+    global _round_prices
+    if _round_prices is None:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional; the NumPy implementation is used instead
+            _round_prices = _round_prices_vectorized
+        else:
+            # nogil lets batch calls round histories on several threads at once
+            _round_prices = njit(cache=True, nogil=True)(_round_prices_loop)
+    return _round_prices
+
+
+def get_stock_history_columnar(symbol: str, period: str = "1y", limit: int = 30) -> dict:
+    """Fetches the last ``limit`` OHLCV rows for a stock as NumPy columns.
+
+    For Python callers (indicators, analysis code) rather than the LLM:
+    "date" is a list of 'YYYY-MM-DD' strings, "open"/"high"/"low"/"close"
+    are unrounded float64 arrays and "volume" is a float64 array too, so a
+    missing volume (e.g. on today's partial row) stays NaN instead of being
+    cast to a bogus integer. float32 would halve the memory but only carries
+    ~7 significant digits, which is not enough for prices in the tens of
+    thousands; float64 holds any real volume exactly. Arguments are as for
+    get_stock_history. Errors are returned as {"error": ...}.
     """
+    import numpy as np
+
+    limit = max(int(limit), 1)
     try:
-        ticker = yf.Ticker(symbol)
-        hist = ticker.history(period=period)
+        ticker = get_ticker(symbol)
+        window_days = max(int(limit * _CALENDAR_DAYS_PER_TRADING_DAY), _MIN_WINDOW_DAYS)
+        if window_days < _PERIOD_DAYS.get(period, 0):
+            start = date.today() - timedelta(days=window_days)
+            hist = ticker.history(start=start, interval="1d")
+            downloaded_period = f"{window_days}d"
+        else:
+            hist = ticker.history(period=period)
+            downloaded_period = period
 
         if hist.empty:
             return {"error": f"No historical data found for '{symbol}' with period '{period}'."}
 
-        # Convert to a list of dicts; limit to last 30 rows for readability
-        records = []
-        for date, row in hist.tail(30).iterrows():
-            records.append({
-                "date": date.strftime("%Y-%m-%d"),
-                "open": round(float(row["Open"]), 2),
-                "high": round(float(row["High"]), 2),
-                "low": round(float(row["Low"]), 2),
-                "close": round(float(row["Close"]), 2),
-                "volume": int(row["Volume"]),
-            })
-
+        tail = hist.tail(limit)
+        start_date, end_date = hist.index[[0, -1]].strftime("%Y-%m-%d")
         return {
             "symbol": symbol,
-            "data_fetched_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "period": period,
+            "downloaded_period": downloaded_period,
             "total_data_points": len(hist),
-            "showing_last": len(records),
-            "start_date": hist.index[0].strftime("%Y-%m-%d"),
-            "end_date": hist.index[-1].strftime("%Y-%m-%d"),
-            "recent_prices": records,
+            "start_date": start_date,
+            "end_date": end_date,
+            "date": tail.index.strftime("%Y-%m-%d").tolist(),
+            "open": tail["Open"].to_numpy(dtype=np.float64),
+            "high": tail["High"].to_numpy(dtype=np.float64),
+            "low": tail["Low"].to_numpy(dtype=np.float64),
+            "close": tail["Close"].to_numpy(dtype=np.float64),
+            "volume": tail["Volume"].to_numpy(dtype=np.float64),
         }
     except Exception as e:
         return {"error": f"Failed to fetch history for '{symbol}': {str(e)}"}
 
 
-def get_stock_financials(symbol: str) -> dict:
+@ttl_cache(PRICE_TTL, error_seconds=ERROR_TTL, persist=True)
+def _get_stock_history(symbol: str, period: str = "1y", limit: int = 30) -> dict:
+    """Synchronous get_stock_history; cached, and also used by get_stock_history_batch."""
+    import numpy as np
+
+    columns = get_stock_history_columnar(symbol, period=period, limit=limit)
+    if "error" in columns:
+        return columns
+
+    # Convert the columns to a list of dicts for the LLM. Rounding runs over
+    # the whole price block, not per value.
+    prices = np.column_stack([columns["open"], columns["high"], columns["low"], columns["close"]])
+    rounded = np.empty_like(prices)
+    _get_round_prices()(prices, rounded)
+    if np.isnan(rounded).any():
+        # Missing prices become None rather than NaN, which is not valid JSON
+        ohlc = np.where(np.isnan(rounded), None, rounded).tolist()
+    else:
+        ohlc = rounded.tolist()
+    volume = columns["volume"]
+    missing_volume = np.isnan(volume)
+    volumes = np.nan_to_num(volume).astype(np.int64)
+    if missing_volume.any():
+        # Same for missing volumes; NaN must not be cast to int64
+        volumes = np.where(missing_volume, None, volumes)
+    records = [
+        {"date": day, "open": o, "high": h, "low": l, "close": c, "volume": v}
+        for day, (o, h, l, c), v in zip(columns["date"], ohlc, volumes.tolist())
+    ]
+
+    return {
+        "symbol": symbol,
+        "data_fetched_at": _fetched_at(),
+        "period": period,
+        "downloaded_period": columns["downloaded_period"],
+        "total_data_points": columns["total_data_points"],
+        "showing_last": len(records),
+        "start_date": columns["start_date"],
+        "end_date": columns["end_date"],
+        "recent_prices": records,
+    }
+
+
+def _latest_values(column, key_fields: list[str]) -> dict:
+    """Pick ``key_fields`` out of one statement column in a single reindex.
+
+    Fields the statement does not report (or reports as NaN) map to None.
+    """
+    return {field: _n(val) for field, val in zip(key_fields, column.reindex(key_fields))}
+
+
+def _statement_from_frame(statement, fields) -> dict:
+    """Summarize the most recent column of a yfinance statement DataFrame."""
+    if statement is None or statement.empty:
+        return {"data": "N/A"}
+
+    latest_col = statement.columns[0]
+    period_label = latest_col.strftime("%Y-%m-%d") if hasattr(latest_col, "strftime") else str(latest_col)
+    return {
+        "period": period_label,
+        "data": _latest_values(statement[latest_col], [label for label, _ in fields]),
+    }
+
+
+def _statements_from_frames(ticker) -> dict:
+    """Build both statement summaries from the Ticker's DataFrame properties."""
+    # The two statements are separate requests; fetch them side by side
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        income_future = pool.submit(lambda: ticker.income_stmt)
+        balance_future = pool.submit(lambda: ticker.balance_sheet)
+        income_stmt = income_future.result()
+        balance_sheet = balance_future.result()
+
+    return {
+        "income_statement": _statement_from_frame(income_stmt, _INCOME_FIELDS),
+        "balance_sheet": _statement_from_frame(balance_sheet, _BALANCE_FIELDS),
+    }
+
+
+def _fetch_statements(symbol: str) -> dict:
+    """Fetch both statement summaries in one request, straight from the JSON.
+
+    Ticker.income_stmt and Ticker.balance_sheet request ~250 series in two
+    calls and build full DataFrames. Only the 13 reported fields are needed,
+    so they are requested together from the same timeseries endpoint and
+    the latest annual value of each is read from the payload.
+    """
+    from yfinance.data import YfData
+
+    keys = [key for _, key in _INCOME_FIELDS + _BALANCE_FIELDS]
+    params = {
+        "symbol": symbol,
+        "type": ",".join(f"annual{key}" for key in keys),
+        "period1": _FUNDAMENTALS_START,
+        "period2": int(time.time()) + 24 * 60 * 60,
+    }
+    data = YfData(session=get_yf_session())
+    response = data.get_raw_json(_FUNDAMENTALS_URL.format(symbol=symbol), params=params)
+
+    results = (response.get("timeseries") or {}).get("result")
+    if not isinstance(results, list):
+        raise ValueError("unexpected timeseries response")
+
+    # key -> {as-of date: value}
+    series = {}
+    for item in results:
+        for name, points in item.items():
+            if name.startswith("annual") and isinstance(points, list):
+                series[name[len("annual"):]] = {
+                    point["asOfDate"]: point.get("reportedValue", {}).get("raw")
+                    for point in points if point
+                }
+
+    statements = {}
+    for name, fields in (("income_statement", _INCOME_FIELDS), ("balance_sheet", _BALANCE_FIELDS)):
+        dates = [day for _, key in fields for day in series.get(key, ())]
+        if not dates:
+            statements[name] = {"data": "N/A"}
+            continue
+        latest = max(dates)  # ISO dates sort chronologically
+        statements[name] = {
+            "period": latest,
+            "data": {label: _n(series.get(key, {}).get(latest)) for label, key in fields},
+        }
+    return statements
+
+
+# Keyed by date as well, so statements are refetched at most once a day
+@ttl_cache(FUNDAMENTALS_TTL, error_seconds=ERROR_TTL, persist=True, daily=True)
+def _get_stock_financials(symbol: str) -> dict:
+    """Synchronous get_stock_financials; cached, and also used by get_stock_financials_batch."""
+    try:
+        result = {
+            "symbol": symbol,
+            "data_fetched_at": _fetched_at(),
+        }
+        try:
+            statements = _fetch_statements(symbol)
+        except Exception as e:
+            # The timeseries endpoint and yfinance's data layer are both private
+            # and may fail or change shape; use the public DataFrame properties
+            logger.warning("Timeseries financials failed for %s (%s); using Ticker statements", symbol, e)
+            statements = _statements_from_frames(get_ticker(symbol))
+        result.update(statements)
+        return result
+    except Exception as e:
+        return {"error": f"Failed to fetch financials for '{symbol}': {str(e)}"}
+
+
+# The tools the agent calls. ADK runs a plain ``def`` tool on the event loop
+# itself, so each one hands its cached synchronous implementation to
+# run_blocking; parallel tool calls then really run side by side.
+
+
+async def get_stock_quote(symbol: str) -> dict:
+    """Fetches the latest price snapshot for an Indian stock.
+
+    Reads only the price chart, not the company profile, and returns
+    prices only. Use it when only prices are needed; for market cap, use
+    get_stock_info or get_quotes_async.
+
+    Args:
+        symbol: NSE/BSE ticker symbol with exchange suffix.
+                Examples: 'RELIANCE.NS', 'TCS.NS', 'INFY.BO'.
+                Use .NS for NSE, .BO for BSE.
+
+    Returns:
+        A dictionary containing current price, previous close, open,
+        day high/low, 52-week high/low, and currency.
+    """
+    return await run_blocking(_get_stock_quote, symbol)
+
+
+async def get_stock_info(symbol: str, include_fundamentals: bool = True) -> dict:
+    """Fetches company info and key fundamentals for an Indian stock.
+
+    Args:
+        symbol: NSE/BSE ticker symbol with exchange suffix.
+                Examples: 'RELIANCE.NS', 'TCS.NS', 'INFY.BO'.
+                Use .NS for NSE, .BO for BSE.
+        include_fundamentals: If False, only the price snapshot from
+                get_stock_quote is returned. Defaults to True.
+
+    Returns:
+        A dictionary containing company name, sector, industry, market cap,
+        P/E ratio, P/B ratio, EPS, dividend yield, 52-week high/low,
+        current price, and other key fundamentals.
+    """
+    return await run_blocking(_get_stock_info, symbol, include_fundamentals)
+
+
+async def get_stock_history(symbol: str, period: str = "1y", limit: int = 30) -> dict:
+    """Fetches historical OHLCV (Open, High, Low, Close, Volume) price data for a stock.
+
+    Args:
+        symbol: NSE/BSE ticker symbol with exchange suffix.
+                Examples: 'RELIANCE.NS', 'TCS.NS', 'INFY.BO'.
+        period: Time period for historical data.
+                Valid values: '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'max'.
+                Defaults to '1y'.
+        limit: Number of most recent trading days to return (at least 1).
+               Defaults to 30. When `limit` days fit in a shorter window than
+               `period`, only that window is downloaded.
+
+    Returns:
+        A dictionary with the stock symbol, the requested period, the
+        downloaded_period actually fetched (e.g. '54d', or the same as period),
+        the number of data points and start/end dates of that downloaded
+        window, and a list of recent price records (last `limit` entries)
+        with date, open, high, low, close, and volume.
+    """
+    return await run_blocking(_get_stock_history, symbol, period, limit)
+
+
+async def get_stock_financials(symbol: str) -> dict:
     """Fetches key financial statements (income statement and balance sheet) for a stock.
 
     Args:
@@ -127,61 +550,134 @@ def get_stock_financials(symbol: str) -> dict:
         (revenue, net income, EBITDA, etc.) and balance sheet items
         (total assets, total debt, cash, etc.).
     """
-    try:
-        ticker = yf.Ticker(symbol)
+    return await run_blocking(_get_stock_financials, symbol)
 
-        result = {
-            "symbol": symbol,
-            "data_fetched_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        }
 
-        # Income statement (most recent annual)
-        income_stmt = ticker.income_stmt
-        if income_stmt is not None and not income_stmt.empty:
-            latest_col = income_stmt.columns[0]
-            period_label = latest_col.strftime("%Y-%m-%d") if hasattr(latest_col, "strftime") else str(latest_col)
-
-            income_data = {}
-            key_fields = [
-                "Total Revenue", "Gross Profit", "EBITDA", "Operating Income",
-                "Net Income", "Basic EPS", "Diluted EPS",
-            ]
-            for field in key_fields:
-                if field in income_stmt.index:
-                    val = income_stmt.loc[field, latest_col]
-                    income_data[field] = float(val) if val is not None else "N/A"
-
-            result["income_statement"] = {
-                "period": period_label,
-                "data": income_data,
-            }
-        else:
-            result["income_statement"] = {"data": "N/A"}
-
-        # Balance sheet (most recent annual)
-        balance_sheet = ticker.balance_sheet
-        if balance_sheet is not None and not balance_sheet.empty:
-            latest_col = balance_sheet.columns[0]
-            period_label = latest_col.strftime("%Y-%m-%d") if hasattr(latest_col, "strftime") else str(latest_col)
-
-            balance_data = {}
-            key_fields = [
-                "Total Assets", "Total Liabilities Net Minority Interest",
-                "Total Debt", "Cash And Cash Equivalents",
-                "Stockholders Equity", "Net Tangible Assets",
-            ]
-            for field in key_fields:
-                if field in balance_sheet.index:
-                    val = balance_sheet.loc[field, latest_col]
-                    balance_data[field] = float(val) if val is not None else "N/A"
-
-            result["balance_sheet"] = {
-                "period": period_label,
-                "data": balance_data,
+async def _fetch_batch(fetch, symbols: list[str], **kwargs) -> dict[str, dict]:
+    """Call ``fetch`` for each unique symbol concurrently, keeping input order.
+
+    Each call runs on the shared worker pool via run_blocking, so the event
+    loop stays free while the batch is in flight. Every Ticker still goes
+    through the shared yfinance session.
+    """
+    unique = list(dict.fromkeys(symbols))
+    results = await asyncio.gather(*(run_blocking(fetch, symbol, **kwargs) for symbol in unique))
+    return dict(zip(unique, results))
+
+
+async def get_stock_info_batch(symbols: list[str]) -> dict:
+    """Fetches company info and key fundamentals for several stocks at once.
+
+    Args:
+        symbols: List of NSE/BSE ticker symbols with exchange suffix.
+                 Example: ['RELIANCE.NS', 'TCS.NS', 'INFY.NS'].
+
+    Returns:
+        A dictionary keyed by symbol; each value is the get_stock_info result
+        for that symbol (or an error dictionary).
+    """
+    return await _fetch_batch(_get_stock_info, symbols)
+
+
+async def get_stock_history_batch(symbols: list[str], period: str = "1y", limit: int = 30) -> dict:
+    """Fetches historical OHLCV price data for several stocks at once.
+
+    Args:
+        symbols: List of NSE/BSE ticker symbols with exchange suffix.
+                 Example: ['RELIANCE.NS', 'TCS.NS', 'INFY.NS'].
+        period: Time period for historical data.
+                Valid values: '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'max'.
+                Defaults to '1y'.
+        limit: Number of most recent trading days to return per symbol.
+               Defaults to 30.
+
+    Returns:
+        A dictionary keyed by symbol; each value is the get_stock_history
+        result for that symbol (or an error dictionary).
+    """
+    return await _fetch_batch(_get_stock_history, symbols, period=period, limit=limit)
+
+
+async def get_stock_financials_batch(symbols: list[str]) -> dict:
+    """Fetches income statement and balance sheet data for several stocks at once.
+
+    Args:
+        symbols: List of NSE/BSE ticker symbols with exchange suffix.
+                 Example: ['RELIANCE.NS', 'TCS.NS'].
+
+    Returns:
+        A dictionary keyed by symbol; each value is the get_stock_financials
+        result for that symbol (or an error dictionary).
+    """
+    return await _fetch_batch(_get_stock_financials, symbols)
+
+
+def _fetch_quote_chunk(symbols: list[str]) -> list[dict]:
+    """Fetch up to QUOTE_BATCH_SIZE quotes in one request.
+
+    Goes through yfinance's data layer, which adds the cookie and crumb
+    Yahoo requires, over the shared session.
+    """
+    from yfinance.data import YfData
+
+    data = YfData(session=get_yf_session())
+    response = data.get_raw_json(_QUOTE_URL, params={"symbols": ",".join(symbols), "formatted": "false"})
+    return (response.get("quoteResponse") or {}).get("result") or []
+
+
+async def get_quotes_async(symbols: list[str]) -> dict:
+    """Fetches the latest price snapshot for many stocks with few requests.
+
+    Symbols are sent 20 per request and the requests run concurrently.
+    Prefer this over several get_stock_quote calls when you need current
+    prices for a list of stocks (e.g. a portfolio).
+
+    Args:
+        symbols: List of NSE/BSE ticker symbols with exchange suffix.
+                 Example: ['RELIANCE.NS', 'TCS.NS', 'INFY.NS'].
+
+    Returns:
+        A dictionary keyed by symbol; each value holds the current price,
+        previous close, open, day high/low, 52-week high/low, market cap,
+        and currency (or an error dictionary).
+    """
+    unique = list(dict.fromkeys(symbols))
+    chunks = [unique[i:i + QUOTE_BATCH_SIZE] for i in range(0, len(unique), QUOTE_BATCH_SIZE)]
+    responses = await asyncio.gather(
+        *(run_blocking(_fetch_quote_chunk, chunk) for chunk in chunks),
+        return_exceptions=True,
+    )
+
+    fetched_at = _fetched_at()
+    results = {}
+    for chunk, response in zip(chunks, responses):
+        if isinstance(response, Exception):
+            for symbol in chunk:
+                results[symbol] = {"error": f"Failed to fetch stock quote for '{symbol}': {str(response)}"}
+            continue
+
+        # Yahoo echoes symbols upper-cased
+        quotes = {str(quote.get("symbol")).upper(): quote for quote in response}
+        for symbol in chunk:
+            quote = quotes.get(symbol.upper())
+            if quote is None:
+                results[symbol] = {"error": f"No price data found for symbol '{symbol}'. Verify the ticker and exchange suffix (.NS for NSE, .BO for BSE)."}
+                continue
+            result = {
+                "symbol": symbol,
+                "data_fetched_at": fetched_at,
+                "currency": quote.get("currency") or "N/A",
             }
-        else:
-            result["balance_sheet"] = {"data": "N/A"}
+            for key, field in _BATCH_QUOTE_FIELDS.items():
+                result[key] = _n(quote.get(field))
+            results[symbol] = result
+    return {symbol: results[symbol] for symbol in unique}
 
-        return result
-    except Exception as e:
-        return {"error": f"Failed to fetch financials for '{symbol}': {str(e)}"}
+
+def get_quotes(symbols: list[str]) -> dict:
+    """Synchronous get_quotes_async for scripts; must not be called from a running event loop."""
+    return asyncio.run(get_quotes_async(symbols))
+
+
+# Start Yahoo's cookie/crumb handshake now so the first tool call does not wait for it
+warm_up()